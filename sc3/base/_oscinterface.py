@@ -115,9 +115,16 @@ class OscInterface(ABC):
         Non empty lists are converted to blobs containing osc messages or
         bundles. Empty strings are sent unchanged.
         '''
+        self.send_msg_list(target, list(args))
+
+    def send_msg_list(self, target, msg):
+        '''
+        msg is a list of values to create one message, as args in send_msg.
+        target is a tuple (hostname, port).
+        '''
         # Time has to be set here for nested bundles (completion msg case).
         send_time = _libsc3.main.current_tt._seconds
-        self._send(self._build_msg(send_time, list(args)), target)
+        self._send(self._build_msg(send_time, msg).dgram, target)
 
     def send_bundle(self, target, time, *elements):
         '''
@@ -129,10 +136,34 @@ class OscInterface(ABC):
         '''
         # Time has to be set here for nested bundles consistency.
         send_time = _libsc3.main.current_tt._seconds
-        self._send(self._build_bundle(send_time, [time, *elements]), target)
+        self._send(
+            self._build_bundle(send_time, [time, *elements]).dgram, target)
+
+    def send_prepared(self, target, template, *args):
+        '''
+        template is an OscMessageTemplate or OscMessagePacker with a
+        precomputed address and type tag string, args are the values
+        of the message.
+        target is a tuple (hostname, port).
+        '''
+        self._send(template.build(*args), target)
+
+    def send_immediate_bundle(self, target, msg, template, *args):
+        '''
+        msg is a list of values to create a message, template is an
+        OscMessageTemplate for the int values in args of the second
+        message, both are sent as an immediate bundle (timetag 1).
+        target is a tuple (hostname, port).
+        '''
+        send_time = _libsc3.main.current_tt._seconds
+        self._send(
+            oli.build_immediate_bundle(
+                self._build_msg(send_time, msg).dgram,
+                template.build(*args)),
+            target)
 
     @abstractmethod
-    def _send(self, msg, target):
+    def _send(self, dgram, target):
         pass
 
     def _build_msg(self, send_time, arg_list):
@@ -286,6 +317,9 @@ class OscUdpInterface(OscInterface):
     def __init__(self, port, port_range=1):
         super().__init__(port, port_range)
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # The socket is shared by all targets and receives from any
+        # address so it can't be connected, sendto is bound once.
+        self._sendto = self._socket.sendto
         self._udp_thread = None
         self._running = False
         self._proto = 'udp'
@@ -325,8 +359,8 @@ class OscUdpInterface(OscInterface):
     def running(self):
         return self._running
 
-    def _send(self, msg, target):  # override
-        self._socket.sendto(msg.dgram, target)
+    def _send(self, dgram, target):  # override
+        self._sendto(dgram, target)
 
 
 class OscTcpInterface(OscInterface):
@@ -405,9 +439,9 @@ class OscTcpInterface(OscInterface):
     def is_connected(self):
         return self._is_connected
 
-    def _send(self, msg, _=None):  # override
-        self._socket.send(msg.size.to_bytes(4, 'big'))
-        self._socket.send(msg.dgram)
+    def _send(self, dgram, _=None):  # override
+        # Connected socket, size prefix and packet in one call.
+        self._socket.sendall(len(dgram).to_bytes(4, 'big') + dgram)
 
 
 class OscNrtInterface(OscInterface):
@@ -432,11 +466,20 @@ class OscNrtInterface(OscInterface):
         # In NRT all messages are bundles at current time.
         self.send_bundle(target, 0.0, list(args))
 
+    def send_msg_list(self, target, msg):  # override
+        self.send_bundle(target, 0.0, msg)
+
     def send_bundle(self, target, time, *elements):  # override
         # Time is calculated in _build_bundle to support
         # sub-bundles relative time by calling _get_timetag().
         self._osc_score.add([time, *elements])
 
+    def send_prepared(self, target, template, *args):  # override
+        self.send_msg(target, template.address, *args)
+
+    def send_immediate_bundle(self, target, msg, template, *args):  # override
+        self.send_bundle(target, None, msg, [template.address, *args])
+
     @staticmethod
     def _get_timetag(send_time, time):  # override
         # Changes in this method must be synced with OscScore._get_logical_time.
@@ -448,7 +491,7 @@ class OscNrtInterface(OscInterface):
             time += send_time
         return int(time * clk.SystemClock._SECONDS_TO_OSC)
 
-    def _send(self, msg, target):
+    def _send(self, dgram, target):
         pass
 
 
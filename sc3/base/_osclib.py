@@ -34,6 +34,7 @@ For more information, please refer to <http://unlicense.org/>
 
 import struct
 import logging
+import functools
 import collections
 from typing import Union, Tuple, Any, Iterator, List
 
@@ -556,6 +557,22 @@ class OscBundleBuilder(object):
             raise OscBundleBuildError('Could not build the bundle') from e
 
 
+_IMMEDIATE_BUNDLE_HEADER = _BUNDLE_PREFIX_DGRAM + _IMMEDIATELY_DGRAM
+
+
+def build_immediate_bundle(*dgrams: bytes) -> bytes:
+    """Returns the datagram of an immediate bundle of message datagrams.
+
+    The contents are not parsed back as in OscBundleBuilder.build, the
+    datagrams must be valid OSC messages.
+    """
+    dgram = bytearray(_IMMEDIATE_BUNDLE_HEADER)
+    for content in dgrams:
+        dgram += write_int(len(content))
+        dgram += content
+    return bytes(dgram)
+
+
 ### OSC Message ###
 
 
@@ -828,6 +845,133 @@ class OscMessageBuilder(object):
             raise OscMessageBuildError(f'Could not build the message') from e
 
 
+### OSC Message Template ###
+
+
+class OscMessageTemplate():
+    """Precomputed datagram header for messages of int only arguments.
+
+    The address and the type tag string are written once at creation and
+    the arguments are packed with a pre-compiled struct on each build.
+    """
+
+    def __init__(self, address: str, num_args: int) -> None:
+        self._address = address
+        self._num_args = num_args
+        self._header = write_string(address) + write_string(',' + 'i' * num_args)
+        self._struct = struct.Struct('>' + 'i' * num_args)
+
+    @property
+    def address(self) -> str:
+        """Returns the OSC address of this template."""
+        return self._address
+
+    @property
+    def num_args(self) -> int:
+        """Returns the number of int arguments of this template."""
+        return self._num_args
+
+    def build(self, *args: int) -> bytes:
+        """Returns the datagram of the message for the given arguments.
+
+        Raises:
+          - BuildError if the arguments could not be packed.
+        """
+        try:
+            return self._header + self._struct.pack(*args)
+        except struct.error as e:
+            raise OscMessageBuildError('Wrong argument values passed') from e
+
+
+class OscMessagePacker():
+    """Precomputed datagram layout for messages of a fixed signature.
+
+    The signature has an item for each argument, the int or float type
+    for values packed on each build, or a str for values that are
+    constant and written once at creation. The '[' and ']' strings are
+    array delimiters as in OscMessageBuilder.
+    """
+
+    def __init__(self, address: str, signature: tuple) -> None:
+        type_tags = ','
+        fmt = '>'
+        consts = []
+        for i, item in enumerate(signature):
+            if item is int:
+                type_tags += 'i'
+                fmt += 'i'
+            elif item is float:
+                type_tags += 'f'
+                fmt += 'f'
+            elif item == '[' or item == ']':
+                type_tags += item
+                fmt += '0s'
+                consts.append((i, b''))
+            elif type(item) is str:
+                value = write_string(item)
+                type_tags += 's'
+                fmt += f'{len(value)}s'
+                consts.append((i, value))
+            else:
+                raise OscMessageBuildError(
+                    f'Unsupported signature item {item!r}')
+        self._address = address
+        self._signature = signature
+        self._header = write_string(address) + write_string(type_tags)
+        self._struct = struct.Struct(fmt)
+        self._consts = tuple(consts)
+
+    @property
+    def address(self) -> str:
+        """Returns the OSC address of this packer."""
+        return self._address
+
+    @property
+    def signature(self) -> tuple:
+        """Returns the signature of this packer."""
+        return self._signature
+
+    def build(self, *args) -> bytes:
+        """Returns the datagram of the message for the given arguments.
+
+        Arguments at constant positions are replaced by their values
+        in the signature.
+
+        Raises:
+          - BuildError if the arguments could not be packed.
+        """
+        values = list(args)
+        for i, value in self._consts:
+            values[i] = value
+        try:
+            return self._header + self._struct.pack(*values)
+        except struct.error as e:
+            raise OscMessageBuildError('Wrong argument values passed') from e
+
+
+def packer_signature(args) -> Union[tuple, None]:
+    """Returns the OscMessagePacker signature of a sequence of values.
+
+    Returns None if there are values other than int, float or str.
+    """
+    signature = []
+    for value in args:
+        value_type = type(value)
+        if value_type is int or value_type is float:
+            signature.append(value_type)
+        elif value_type is str:
+            signature.append(value)
+        else:
+            return None
+    return tuple(signature)
+
+
+@functools.lru_cache(maxsize=256)
+def message_packer(address: str, signature: tuple) -> OscMessagePacker:
+    """Returns a cached OscMessagePacker for address and signature."""
+    return OscMessagePacker(address, signature)
+
+
 ### OSC Packet ###
 
 
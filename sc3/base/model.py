@@ -8,6 +8,17 @@ from . import functions as fn
 __all__ = ['NotificationCenter']
 
 
+class _FlaggedAction():
+    # Registration value of actions with options, plain actions are
+    # stored as is.
+    __slots__ = ('action', 'auto_unregister', 'only_obj')
+
+    def __init__(self, action, auto_unregister, only_obj):
+        self.action = action
+        self.auto_unregister = auto_unregister
+        self.only_obj = only_obj
+
+
 class NotificationCenter():
     _registrations = weakref.WeakKeyDictionary()
 
@@ -18,14 +29,26 @@ class NotificationCenter():
     def notify(cls, obj, msg, *args, **kwargs):
         if obj in cls._registrations and msg in cls._registrations[obj]:
             for listener, action in cls._registrations[obj][msg].copy().items():
+                if type(action) is _FlaggedAction:
+                    if action.auto_unregister:
+                        cls.unregister(obj, msg, listener)
+                    if action.only_obj:
+                        fn.value(action.action, obj)
+                        continue
+                    action = action.action
                 fn.value(action, obj, msg, listener, *args, **kwargs)
 
     @classmethod
-    def register(cls, obj, msg, listener, action):
+    def register(cls, obj, msg, listener, action,
+                 auto_unregister=False, only_obj=False):
+        # auto_unregister: unregistered before the action is evaluated.
+        # only_obj: the action is evaluated with obj as the only argument.
         if obj not in cls._registrations:
             cls._registrations[obj] = dict()
         if msg not in cls._registrations[obj]:
             cls._registrations[obj][msg] = weakref.WeakKeyDictionary()
+        if auto_unregister or only_obj:
+            action = _FlaggedAction(action, auto_unregister, only_obj)
         cls._registrations[obj][msg][listener] = action
 
     @classmethod
@@ -46,10 +69,7 @@ class NotificationCenter():
 
     @classmethod
     def register_one_shot(cls, obj, msg, listener, action):
-        def one_shot_action(*args):
-            action(*args)
-            cls.unregister(obj, msg, listener)
-        cls.register(obj, msg, listener, one_shot_action)
+        cls.register(obj, msg, listener, action, True)
 
     @classmethod
     def registration_exists(cls, obj, msg, listener):
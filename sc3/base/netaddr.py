@@ -167,6 +167,73 @@ class NetAddr():
 
         self._osc_interface.send_msg(self._target, *args)
 
+    def send_msg_list(self, msg):
+        '''Send an OSC message from a list.
+
+        Parameters
+        ----------
+        msg: list
+            OSC address followed by zero or more values that compose the
+            message. The list is used as is, it must not be modified
+            after the call.
+
+        Notes
+        -----
+        Same as ``send_msg`` for messages that are already built as a
+        list, e.g. by appending arguments to it, avoids to copy the
+        values. Invoked as::
+
+          addr.send_msg_list(['/osc_addr', p1, p2, ...])
+        '''
+
+        self._osc_interface.send_msg_list(self._target, msg)
+
+    def send_prepared(self, template, *args):
+        '''Send an OSC message built from a precomputed template.
+
+        Parameters
+        ----------
+        template: OscMessageTemplate | OscMessagePacker
+            Template with the address and type tag string of an int
+            only message, or a packer for a fixed message signature.
+        *args: int | float | str
+            Values of the message, must match the template.
+
+        Notes
+        -----
+        This method is a fast path for frequent messages of constant
+        type tags, e.g. node commands, the result is the same as::
+
+          addr.send_msg(template.address, *args)
+        '''
+
+        self._osc_interface.send_prepared(self._target, template, *args)
+
+    def send_immediate_bundle(self, msg, template, *args):
+        '''Send a message and a prepared message as an immediate bundle.
+
+        Parameters
+        ----------
+        msg: list
+            OSC address followed by zero or more values of the first
+            message.
+        template: OscMessageTemplate
+            Template of the second message, an int only message.
+        *args: int
+            Values of the second message, must match the template.
+
+        Notes
+        -----
+        This method is a fast path for commands that need to be followed
+        by another command in the same bundle, e.g. creating a paused
+        synth, the result is the same as::
+
+          addr.send_bundle(None, msg, [template.address, *args])
+        '''
+
+        self._osc_interface.send_immediate_bundle(
+            self._target, msg, template, *args)
+
     def send_bundle(self, time, *elements):
         '''Send an OSC bundle to the server.
 
@@ -346,12 +413,17 @@ class BundleNetAddr(NetAddr):
     '''
     This class is a context manager that acts as a proxy of the current
     NetAddr and collects single messages to be sent as a bundle. It's main
-    use is through 'bind' method of the server objects.
+    use is through 'bind' and 'bundle' methods of the server objects.
+
+    If 'latency' is not given the bundle is sent with the latency of the
+    server, or immediately if the target is a NetAddr.
     '''
 
     class _SYNC_FLAG(): pass
+    class _SERVER_LATENCY(): pass
 
-    def __init__(self, target, arg_list=None, send=True):
+    def __init__(self, target, arg_list=None, send=True,
+                 latency=_SERVER_LATENCY):
         if isinstance(target, NetAddr):
             self._save_addr = target
             self._server = None
@@ -361,6 +433,7 @@ class BundleNetAddr(NetAddr):
         super().__init__(self._save_addr._hostname, self._save_addr._port)
         self._bundle = arg_list or []
         self._send = send
+        self._latency = latency
         self._last_sync = -1
 
     def has_bundle(self):
@@ -371,6 +444,15 @@ class BundleNetAddr(NetAddr):
     def send_msg(self, *args):
         self._bundle.append(list(args))
 
+    def send_msg_list(self, msg):
+        self._bundle.append(msg)
+
+    def send_prepared(self, template, *args):
+        self._bundle.append([template.address, *args])
+
+    def send_immediate_bundle(self, msg, template, *args):
+        self._bundle.extend((msg, [template.address, *args]))
+
     def send_bundle(self, time, *elements):
         self._bundle.extend(list(elements))  # Discard time.
 
@@ -388,7 +470,10 @@ class BundleNetAddr(NetAddr):
         self._bundle.append([self._SYNC_FLAG, latency, elements])
 
     def _send_last_bundle(self):
-        time = self._server.latency if self._server else None
+        if self._latency is self._SERVER_LATENCY:
+            time = self._server.latency if self._server else None
+        else:
+            time = self._latency
         bundle = self._bundle[self._last_sync+1:]
         if bundle:
             self._save_addr.send_clumped_bundles(time, *bundle)
@@ -12,7 +12,7 @@ from . import clock as clk
 
 __all__ = [
     'Routine', 'routine', 'FunctionStream',
-    'Condition', 'FlowVar', 'stream', 'embed']
+    'Condition', 'OneShot', 'FlowVar', 'stream', 'embed']
 
 
 ### Thread.sc ###
@@ -761,6 +761,78 @@ class Condition():
                 tt._clock.sched(0, tt)
 
 
+class OneShot():
+    '''
+    Stop the execution of a routine playing on a clock until an event
+    happens once.
+
+    Lightweight version of `Condition` for a single routine waiting for
+    a single event, e.g. a node being freed. Once set it stays set and
+    later waits resume immediately. See `wait` method for example usage.
+
+    '''
+
+    __slots__ = ('_is_set', '_waiting_thread')
+
+    def __init__(self):
+        self._is_set = False
+        self._waiting_thread = None
+
+    @property
+    def is_set(self):
+        '''Return `True` if `set` was called.'''
+        return self._is_set
+
+    def wait(self):
+        '''
+        Return a generator that will remove the routine from the clock
+        by returning a string until `set` is called. If it was already
+        set it rechedules the routine immediately.
+
+        ::
+
+            event = OneShot()
+            @routine
+            def r():
+                yield from event.wait()  # Waiting.
+                print('resumed')
+            r.play()
+
+            event.set()  # Resume the routine.
+
+        Raises
+        ------
+        Exeption
+            If the generator is yield outside a routine or if there is
+            already a routine waiting.
+
+        '''
+
+        current_tt = _libsc3.main.current_tt
+        if current_tt is _libsc3.main.main_tt:
+            raise Exception(
+                f'{type(self).__name__}.wait() called outside a routine')
+        if not self._is_set:
+            if self._waiting_thread is not None:
+                raise Exception(
+                    f'{type(self).__name__} already has a waiting routine')
+            self._waiting_thread = current_tt.thread_player
+            yield 'hang'  # Arbitrary non numeric value.
+        else:
+            yield 0
+
+    def set(self):
+        '''Set the event and reschedule the waiting routine if any.'''
+        with _libsc3.main._main_lock:
+            if self._is_set:
+                return
+            self._is_set = True
+            tt = self._waiting_thread
+            self._waiting_thread = None
+            if tt is not None:
+                tt._clock.sched(0, tt)
+
+
 class FlowVar():
     '''
     Defer the execution of a routine playing in a clock until a value is set.
@@ -1,7 +1,9 @@
 """Engine.sc"""
 
+import itertools
 import math
 import logging
+import threading
 
 from ..base import builtins as bi
 
@@ -16,6 +18,7 @@ class NodeIDAllocator():
         self.user = user
         self._init_temp = init_temp
         self.num_ids = (2 ** 32 // 2 - 1) // 64  # +int32, 64 logins safe range.
+        self._wrap_lock = threading.Lock()
         self.reset()
 
     def id_offset(self):
@@ -23,15 +26,35 @@ class NodeIDAllocator():
 
     def reset(self):
         self._mask = self.user << 26
-        self._temp = self._init_temp
+        # Temp IDs wrap around to init_temp after 0x03FFFFFF. The count
+        # is only replaced with _wrap_lock held, IDs taken from the old
+        # count past the maximum are taken again from the new one.
+        self._temp = itertools.count(self._init_temp)
         self._perm = 2
         self._perm_freed = set()
 
     def alloc(self):
-        x = self._temp
-        self._temp = bi.wrap(x + 1, self._init_temp, 0x03FFFFFF)
+        x = next(self._temp)
+        if x > 0x03FFFFFF:
+            with self._wrap_lock:
+                x = next(self._temp)
+                if x > 0x03FFFFFF:
+                    x = self._init_temp
+                    self._temp = itertools.count(x + 1)
         return x | self._mask
 
+    def alloc_block(self, n):
+        # IDs are unique but consecutive only if no other thread
+        # allocates at the same time.
+        with self._wrap_lock:
+            ids = [x for x in itertools.islice(self._temp, n) if x <= 0x03FFFFFF]
+            over = n - len(ids)
+            if over > 0:
+                ids.extend(range(self._init_temp, self._init_temp + over))
+                self._temp = itertools.count(self._init_temp + over)
+        mask = self._mask
+        return [x | mask for x in ids]
+
     def alloc_perm(self):
         if len(self._perm_freed) > 0:
             x = min(self._perm_freed)
@@ -29,6 +29,11 @@ lne = hks.late_import(__name__, 'sc3.synth.ugens.line', 'lne')
 ### Graphs Parameter Base Class ###
 
 class GraphParameter():
+    # The value is stored by subclasses, either in a slot or in the
+    # instance dictionary (UGenParameter can't define slots because of
+    # ChannelList's list base).
+    __slots__ = ()
+
     def __init__(self, value):
         self.__param_value = value
 
@@ -275,6 +280,9 @@ class UGenSequence(UGenParameter):
 ### Node Graph Parameters ###
 
 class NodeParameter(GraphParameter):
+    # Node parameters are created for every message conversion.
+    __slots__ = ('_GraphParameter__param_value',)
+
     # asTarget.sc interface
     def _as_target(self):
         raise TypeError(
@@ -296,11 +304,18 @@ class NodeParameter(GraphParameter):
     def _as_osc_arg_list(self):
         return [self._as_control_input()]
 
+    def _write_osc_args(self, lst):
+        # Same as _as_osc_arg_list but appends the arguments to an existing
+        # message list, subclasses can override it to avoid the temporary.
+        lst.extend(self._as_osc_arg_list())
+
     def _embed_as_osc_arg(self, lst):
         lst.append(self._as_control_input())
 
 
 class NodeNone(NodeParameter):
+    __slots__ = ()
+
     @classmethod
     def _param_type(cls):
         return (type(None),)
@@ -310,6 +325,8 @@ class NodeNone(NodeParameter):
 
 
 class NodeScalar(NodeParameter):
+    __slots__ = ()
+
     @classmethod
     def _param_type(cls):
         return (int, float)
@@ -319,12 +336,16 @@ class NodeScalar(NodeParameter):
 
 
 class NodeString(NodeParameter):
+    __slots__ = ()
+
     @classmethod
     def _param_type(cls):
         return (str,)
 
 
 class NodeSequence(NodeParameter):
+    __slots__ = ()
+
     @classmethod
     def _param_type(cls):
         return (list, tuple)
@@ -335,9 +356,12 @@ class NodeSequence(NodeParameter):
 
     def _as_osc_arg_list(self):
         lst = []
+        self._write_osc_args(lst)
+        return lst
+
+    def _write_osc_args(self, lst):
         for e in self._param_value:
             node_param(e)._embed_as_osc_arg(lst)
-        return lst
 
     def _embed_as_osc_arg(self, lst):
         lst.append('[')
@@ -349,6 +373,8 @@ class NodeSequence(NodeParameter):
 class NodeDictionary(NodeParameter):
     # Used to convert dict to a flat list of key-value pairs.
 
+    __slots__ = ()
+
     @classmethod
     def _param_type(cls):
         return (dict,)
@@ -361,6 +387,11 @@ class NodeDictionary(NodeParameter):
     def _as_osc_arg_list(self):
         return self._as_control_input()
 
+    def _write_osc_args(self, lst):
+        for items in self._param_value.items():
+            for x in items:
+                lst.append(node_param(x)._as_control_input())
+
     def _embed_as_osc_arg(self, lst):
         lst.append('[')
         for item in self._param_value.items():
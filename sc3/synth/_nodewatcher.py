@@ -3,6 +3,7 @@
 from ..base import responders as rpd
 from ..base import systemactions as sac
 from ..base import model as mdl
+from ..base import functions as fn
 
 
 # // Watches a server address for node-related messages
@@ -129,3 +130,70 @@ class NodeWatcher():
 
     def __on_server_quit(self, _):
         self._clear()
+
+
+class NodeReplyWatcher():
+    # // Routes node query replies to the actions waiting for them.
+    # // One permanent responder per command for all the nodes of the server,
+    # // pending actions are looked up by the reply arguments.
+    _CMDS = ('/n_set', '/n_setn', '/n_info')
+
+    def __init__(self, server):
+        self._server = server
+        self._pending = {cmd: dict() for cmd in self._CMDS}
+        self._responders = []
+        for cmd in self._CMDS:
+            method = '_' + cmd[1:]
+            osc_func = rpd.OscFunc(
+                (lambda mthd:
+                    lambda msg, *_:
+                        getattr(self, mthd)(msg))(method),
+                cmd, self._server.addr)
+            osc_func.permanent = True
+            self._responders.append(osc_func)
+        sac.CmdPeriod.add(self.__on_cmd_period)
+        sac.ServerBoot.add(self._server, self.__on_server_boot)
+        sac.ServerQuit.add(self._server, self.__on_server_quit)
+
+    @property
+    def server(self):
+        return self._server
+
+    @property
+    def responders(self):
+        return self._responders
+
+    def add(self, cmd, key, action):
+        # Key is (node_id, index) for '/n_set' and '/n_setn', node_id for
+        # '/n_info'. Actions with the same key are evaluated by one reply.
+        self._pending[cmd].setdefault(key, []).append(action)
+
+    def _clear(self):
+        for pending in self._pending.values():
+            pending.clear()
+
+    def _n_set(self, msg):  # response to /s_get
+        # // [/n_set, node ID, index, value].
+        for action in self._pending['/n_set'].pop((msg[1], msg[2]), ()):
+            fn.value(action, msg[3])
+
+    def _n_setn(self, msg):  # response to /s_getn
+        # // [/n_setn, node ID, index, count, *values].
+        for action in self._pending['/n_setn'].pop((msg[1], msg[2]), ()):
+            fn.value(action, msg[4:])
+
+    def _n_info(self, msg):  # response to /n_query
+        for action in self._pending['/n_info'].pop(msg[1], ()):
+            action(*msg)
+
+
+    ### System Actions ###
+
+    def __on_cmd_period(self):
+        self._clear()
+
+    def __on_server_boot(self, _):
+        self._clear()
+
+    def __on_server_quit(self, _):
+        self._clear()
@@ -1,13 +1,17 @@
 """Node.sc"""
 
+import collections
 import logging
+import sys
+import threading
+import types
 
-from ..base import utils as utl
 from ..base import responders as rpd
 from ..base import functions as fn
 from ..base import model as mdl
 from ..base import stream as stm
 from ..base import clock as clk
+from ..base import _osclib as oli
 from . import server as srv
 from . import synthdesc as sdc
 from . import _graphparam as gpp
@@ -19,6 +23,40 @@ __all__ = ['Group', 'ParGroup', 'Synth']
 _logger = logging.getLogger(__name__)
 
 
+# Precomputed headers of int only node commands.
+_N_FREE = oli.OscMessageTemplate('/n_free', 1)  # 11
+_N_RUN = oli.OscMessageTemplate('/n_run', 2)  # 12
+_N_TRACE = oli.OscMessageTemplate('/n_trace', 1)  # 10
+_N_BEFORE = oli.OscMessageTemplate('/n_before', 2)  # 18
+_N_AFTER = oli.OscMessageTemplate('/n_after', 2)  # 19
+_G_HEAD = oli.OscMessageTemplate('/g_head', 2)  # 22
+_G_TAIL = oli.OscMessageTemplate('/g_tail', 2)  # 23
+
+
+_NewNode = collections.namedtuple(
+    '_NewNode', 'server node_id group target_nid add_action_id')
+
+
+_ADD_ACTIONS = {
+    # Traditional.
+    'addToHead': 0,
+    'addToTail': 1,
+    'addBefore': 2,
+    'addAfter': 3,
+    'addReplace': 4,
+    # Simple.
+    'head': 0,
+    'tail': 1,
+    'before': 2,
+    'after': 3,
+    'replace': 4,
+    # Shortcut.
+    'h': 0, 't': 1, 'b': 2, 'a': 3, 'r': 4,
+    # // valid action numbers should stay the same
+    0: 0, 1: 1, 2: 2, 3: 3, 4: 4
+}
+
+
 class Node(gpp.NodeParameter):
     '''Base class for ``Group`` and ``Synth``.
 
@@ -41,30 +79,29 @@ class Node(gpp.NodeParameter):
 
     '''
 
-    add_actions = {
-        # Traditional.
-        'addToHead': 0,
-        'addToTail': 1,
-        'addBefore': 2,
-        'addAfter': 3,
-        'addReplace': 4,
-        # Simple.
-        'head': 0,
-        'tail': 1,
-        'before': 2,
-        'after': 3,
-        'replace': 4,
-        # Shortcut.
-        'h': 0, 't': 1, 'b': 2, 'a': 3, 'r': 4,
-        # // valid action numbers should stay the same
-        0: 0, 1: 1, 2: 2, 3: 3, 4: 4
-    }
+    # Weak references are needed by NotificationCenter.
+    __slots__ = (
+        'server', 'node_id', 'group',
+        '_is_playing', '_is_running', '__weakref__')
+
+    add_actions = types.MappingProxyType(_ADD_ACTIONS)  # Read only.
 
     _register_all = False
 
     def __init__(self):
         super(gpp.NodeParameter, self).__init__(self)
 
+    @staticmethod
+    def _resolve_new(target, add_action):
+        # Common creation values of nodes that send immediately.
+        target = _as_target(target)
+        server = target.server
+        add_action_id = _ADD_ACTIONS[add_action]
+        return _NewNode(
+            server, server._next_node_id(),
+            target if add_action_id < 2 else target.group,
+            target.node_id, add_action_id)
+
     def _init_register(self, register):
         self._is_playing = None  # None (not watched/no info), True or False
         self._is_running = None  # None (not watched/no info), True or False
@@ -117,9 +154,8 @@ class Node(gpp.NodeParameter):
         obj._is_running = None  # None (not watched/no info), True or False
         return obj
 
-    @classmethod
-    def _action_number_for(cls, add_action):
-        return cls.add_actions[add_action]
+    # Built-in bound method, doesn't bind to the class or instances.
+    _action_number_for = _ADD_ACTIONS.__getitem__
 
     def free(self, send_flag=True):
         '''Stop this node and free it from its parent group on the server.
@@ -137,7 +173,7 @@ class Node(gpp.NodeParameter):
         '''
 
         if send_flag:
-            self.server.addr.send_msg('/n_free', self.node_id) # 11
+            self.server.addr.send_prepared(_N_FREE, self.node_id)
         self.group = None
 
     def run(self, flag=True):
@@ -151,7 +187,7 @@ class Node(gpp.NodeParameter):
 
         '''
 
-        self.server.addr.send_msg('/n_run', self.node_id, int(flag)) # 12
+        self.server.addr.send_prepared(_N_RUN, self.node_id, int(flag))
 
     def map(self, *args):
         '''Map controls in this node to read from control rate buses.
@@ -261,15 +297,20 @@ class Node(gpp.NodeParameter):
 
     @staticmethod
     def _process_mn_args(tpl):
-        data = []
-        for control, bus in utl.gen_cclumps(tpl, 2):
+        # Indexed loop instead of gen_cclumps, incomplete pairs are discarded.
+        node_param = gpp.node_param
+        data = [None] * (len(tpl) // 2 * 3)
+        j = 0
+        for i in range(0, len(tpl) - 1, 2):
+            bus = tpl[i + 1]
+            data[j] = node_param(tpl[i])._as_control_input()
             if isinstance(bus, int):
-                data.extend([
-                    gpp.node_param(control)._as_control_input(), bus, 1])
+                data[j + 1] = bus
+                data[j + 2] = 1
             else:
-                data.extend([
-                    gpp.node_param(control)._as_control_input(),
-                    bus.index, bus.channels])
+                data[j + 1] = bus.index
+                data[j + 2] = bus.channels
+            j += 3
         return data
 
     def set(self, *args):
@@ -297,9 +338,9 @@ class Node(gpp.NodeParameter):
 
         '''
 
-        self.server.addr.send_msg(
-            '/n_set', self.node_id,  # 15
-            *gpp.node_param(args)._as_osc_arg_list())
+        msg = ['/n_set', self.node_id]  # 15
+        gpp.node_param(args)._write_osc_args(msg)
+        _send_packed(self.server.addr, msg)
 
     def setn(self, *args):
         '''Set ranges of adjacent controls in this node to values.
@@ -308,15 +349,17 @@ class Node(gpp.NodeParameter):
 
         '''
 
-        arg_list = []
+        arg_list = ['/n_setn', self.node_id]  # 16
         args = gpp.node_param(args)._as_control_input()
-        for control, more_vals in utl.gen_cclumps(args, 2):
+        for i in range(0, len(args) - 1, 2):
+            more_vals = args[i + 1]
             if isinstance(more_vals, list):
-                arg_list.extend([control, len(more_vals), *more_vals])
+                arg_list.extend((args[i], len(more_vals)))
+                arg_list.extend(more_vals)
             else:
-                arg_list.extend([control, 1, more_vals])
+                arg_list.extend((args[i], 1, more_vals))
 
-        self.server.addr.send_msg('/n_setn', self.node_id, *arg_list)  # 16
+        _send_packed(self.server.addr, arg_list)
 
     def fill(self, cname, num_controls, value, *args):
         '''Set sequential ranges of controls in this node to a single value.
@@ -383,6 +426,30 @@ class Node(gpp.NodeParameter):
         self.server.addr.send_bundle(
             self.server.latency, ['/n_set', self.node_id, 'gate', time])  # 15
 
+    def batched(self, latency=None):
+        '''Collect the messages sent to this node's server in a bundle.
+
+        Parameters
+        ----------
+        latency : None | float | int
+            Bundle's latency. Default is `None`, the bundle is performed
+            immediately by the server.
+
+        Notes
+        -----
+        This method returns the context manager of the server's
+        ``bundle`` method. All the messages sent to the server within
+        the `with` statement, from this or any other node, are sent as
+        a single bundle on exit::
+
+            with x.batched():
+                x.set('freq', 440)
+                x.map('amp', bus)
+
+        '''
+
+        return self.server.bundle(latency)
+
     def trace(self):
         '''Dump internal synth or group information to stdout.
 
@@ -393,7 +460,7 @@ class Node(gpp.NodeParameter):
 
         '''
 
-        self.server.addr.send_msg('/n_trace', self.node_id) # 10
+        self.server.addr.send_prepared(_N_TRACE, self.node_id)
 
     def query(self, action=None):
         '''Retrieve information about this node within the server tree.
@@ -439,10 +506,7 @@ class Node(gpp.NodeParameter):
                             f'\n   tail: {tail}')
                 print(msg)
 
-        rpd.OscFunc(
-            lambda msg, *_: action(*msg),
-            '/n_info', self.server.addr,
-            arg_template=[self.node_id]).one_shot()
+        self.server._node_replies.add('/n_info', self.node_id, action)
         self.server.addr.send_msg('/n_query', self.node_id)
 
     def register(self, playing=True, running=True):
@@ -483,12 +547,10 @@ class Node(gpp.NodeParameter):
 
         '''
 
-        def action_wrapper():
-            fn.value(action, self)
-            mdl.NotificationCenter.unregister(self, '/n_end', self)
-
         self.register()
-        mdl.NotificationCenter.register(self, '/n_end', self, action_wrapper)
+        mdl.NotificationCenter.register(
+            self, '/n_end', self, action,
+            auto_unregister=True, only_obj=True)
 
     def wait_for_free(self):
         '''Wait until this Node is freed.
@@ -497,9 +559,9 @@ class Node(gpp.NodeParameter):
 
         '''
 
-        condition = stm.Condition()
-        self.on_free(lambda: condition.unhang())
-        yield from condition.wait()
+        event = stm.OneShot()
+        self.on_free(event.set)
+        yield from event.wait()
 
     def move_before(self, target):
         '''Move this node to be directly before ``target``.
@@ -521,8 +583,8 @@ class Node(gpp.NodeParameter):
         '''
 
         self.group = target.group
-        self.server.addr.send_msg(
-            '/n_before', self.node_id, target.node_id)  # 18
+        self.server.addr.send_prepared(
+            _N_BEFORE, self.node_id, target.node_id)
 
     def move_after(self, target):
         '''Move this node to be directly after ``target``.
@@ -544,8 +606,8 @@ class Node(gpp.NodeParameter):
         '''
 
         self.group = target.group
-        self.server.addr.send_msg(
-            '/n_after', self.node_id, target.node_id)  # 19
+        self.server.addr.send_prepared(
+            _N_AFTER, self.node_id, target.node_id)
 
     def move_to_head(self, target=None):
         '''Move this node to head of the ``target`` group.
@@ -595,11 +657,38 @@ class Node(gpp.NodeParameter):
         return self
 
 
+def _as_target(obj):
+    # Nodes are the common case, skip the parameter wrapper.
+    if isinstance(obj, Node):
+        return obj
+    return gpp.node_param(obj)._as_target()
+
+
+def _send_packed(addr, msg):
+    # Messages of int, float and str values, e.g. controls' names and
+    # values, are built from a cached layout of their signature.
+    signature = oli.packer_signature(msg[1:])
+    if signature is None:
+        addr.send_msg_list(msg)
+    else:
+        addr.send_prepared(oli.message_packer(msg[0], signature), *msg[1:])
+
+
 class AbstractGroup(Node):
     '''Base class for ``Group`` and ``ParGroup``.
 
     '''
 
+    __slots__ = ()
+    _CREATION_CMD = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._CREATION_CMD is None:
+            raise NotImplementedError(
+                f'{cls.__name__} must define _CREATION_CMD')
+        cls._creation_template = oli.OscMessageTemplate(cls._CREATION_CMD, 3)
+
     def __init__(self, target=None, add_action='addToHead', register=False):
         '''Create a group node in the server.
 
@@ -618,15 +707,12 @@ class AbstractGroup(Node):
 
         # // Immediately sends.
         super().__init__()
-        target = gpp.node_param(target)._as_target()
-        self.server = target.server
-        self.node_id = self.server._next_node_id()
-        add_action_id = type(self).add_actions[add_action]
-        self.group = target if add_action_id < 2 else target.group
+        new = Node._resolve_new(target, add_action)
+        self.server, self.node_id, self.group = new.server, new.node_id, new.group
         self._init_register(register)
-        self.server.addr.send_msg(
-            self.creation_cmd(), self.node_id,
-            add_action_id, target.node_id)
+        new.server.addr.send_prepared(
+            self._creation_template, new.node_id,
+            new.add_action_id, new.target_nid)
 
     @classmethod
     def after(cls, target):
@@ -672,11 +758,11 @@ class AbstractGroup(Node):
 
     def _move_node_to_head(self, node):
         node.group = self
-        self.server.addr.send_msg('/g_head', self.node_id, node.node_id) # 22
+        self.server.addr.send_prepared(_G_HEAD, self.node_id, node.node_id)
 
     def _move_node_to_tail(self, node):
         node.group = self
-        self.server.addr.send_msg('/g_tail', self.node_id, node.node_id) # 23
+        self.server.addr.send_prepared(_G_TAIL, self.node_id, node.node_id)
 
     def free_all(self):
         '''Free all children nodes.
@@ -721,45 +807,43 @@ class AbstractGroup(Node):
 
         '''
 
-        done = False
+        done = threading.Event()
 
         def resp_func(msg, *_):
+            done.set()
+            # [cmd, flag, node_id, num_children, *children], each child is
+            # [node_id, num_children] for groups or [node_id, -1, def_name]
+            # for synths plus [num_controls, *pairs] if flag is set.
             print_controls = bool(msg[1])
-            key_name = f'Group({msg[2]})'
             outdct = dict()
-            outdct[key_name] = dict()
-            i = 2
-
-            if msg[3] > 0:
-                def dump_func(outdct, num_children):
-                    nonlocal i
-                    for _ in range(num_children):
-                        if msg[i + 1] >= 0:
-                            i += 2
-                        else:
-                            if print_controls:
-                                i += msg[i + 3] * 2 + 1
-                            i += 3
-                        node_id = f'{msg[i]}'
-                        if msg[i + 1] >= 0:
-                            key_name = f'Group({node_id})'
-                            outdct[key_name] = dict()
-                            if msg[i + 1] > 0:
-                                dump_func(outdct[key_name], msg[i + 1])
-                        else:
-                            key_name = f'Synth({node_id}, {msg[i + 2]})'
-                            outdct[key_name] = dict()
-                            if print_controls:
-                                j = 0
-                                for _ in range(msg[i + 3]):
-                                    outdct[key_name][f'{msg[i + 4 + j]}'] =\
-                                        msg[i + 5 + j]
-                                    j += 2
-
-                dump_func(outdct[key_name], msg[3])
-
-            nonlocal done
-            done = True
+            outdct[f'Group({msg[2]})'] = children = dict()
+            stack = [[children, msg[3]]]  # [dict, remaining children]
+            i = 4
+
+            while stack:
+                top = stack[-1]
+                if top[1] == 0:
+                    stack.pop()
+                    continue
+                top[1] -= 1
+                node_id = msg[i]
+                num_children = msg[i + 1]
+                if num_children >= 0:
+                    top[0][f'Group({node_id})'] = children = dict()
+                    if num_children > 0:
+                        stack.append([children, num_children])
+                    i += 2
+                elif print_controls:
+                    top[0][f'Synth({node_id}, {msg[i + 2]})'] =\
+                        controls = dict()
+                    j = i + 4
+                    i = j + msg[i + 3] * 2
+                    while j < i:
+                        controls[f'{msg[j]}'] = msg[j + 1]
+                        j += 2
+                else:
+                    top[0][f'Synth({node_id}, {msg[i + 2]})'] = dict()
+                    i += 3
 
             if action:
                 fn.value(action, outdct)
@@ -770,7 +854,7 @@ class AbstractGroup(Node):
         resp.one_shot()
 
         def timeout_func():
-            if not done:
+            if not done.is_set():
                 resp.free()
                 _logger.warning(
                     f"server '{self.server.name}' failed to respond "
@@ -780,20 +864,16 @@ class AbstractGroup(Node):
         clk.SystemClock.sched(timeout, timeout_func)
 
     def _pretty_tree(self, d, indent=0, tab=2):
+        node_indent = ' ' * tab * indent
+        ctrl_indent = node_indent + ' ' * tab
         for key, value in d.items():
-            _logger.info(' ' * tab * indent + str(key))
+            _logger.info(node_indent + str(key))
             if key.startswith('Synth'):
-                log = ' ' * tab * (indent + 1)
-                for k, v in value.items():
-                    log += f'{k}: {v} '
-                _logger.info(log)
+                _logger.info(ctrl_indent + ' '.join(
+                    f'{k}: {v}' for k, v in value.items()))
             elif isinstance(value, dict):
                 self._pretty_tree(value, indent+1)
 
-    @staticmethod
-    def creation_cmd():
-        raise NotImplementedError()
-
     def __repr__(self):
         return f'{type(self).__name__}({self.node_id})'
 
@@ -803,9 +883,8 @@ class Group(AbstractGroup):
 
     '''
 
-    @staticmethod
-    def creation_cmd():
-        return '/g_new' # 21
+    __slots__ = ()
+    _CREATION_CMD = '/g_new'  # 21
 
 
 class ParGroup(AbstractGroup):
@@ -815,9 +894,8 @@ class ParGroup(AbstractGroup):
 
     '''
 
-    @staticmethod
-    def creation_cmd():
-        return '/p_new' # 63
+    __slots__ = ()
+    _CREATION_CMD = '/p_new'  # 63
 
 
 class RootNode(Group):
@@ -827,7 +905,8 @@ class RootNode(Group):
     a root node of ID 0. This is intended for internal use only and
     should not be confused with the default group. Root nodes are
     always playing, always running, cannot be freed, or moved anywhere.
-    Caching is used so that there is always one root node per server.::
+    There is always one root node per server, each server holds its
+    own root node for as long as it exists.::
 
         s = Server.default
         a = RootNode(s)
@@ -849,12 +928,14 @@ class RootNode(Group):
 
     '''
 
-    roots = dict()
+    __slots__ = ()
 
     def __new__(cls, server=None):
         server = server or srv.Server.default
-        if server.name in cls.roots:
-            return cls.roots[server.name]
+        # Owned by the server, no class level cache keeps it alive.
+        obj = getattr(server, '_root_node', None)
+        if obj is not None:
+            return obj
         else:
             obj = super(gpp.NodeParameter, cls).__new__(cls)
             obj.server = server
@@ -862,7 +943,7 @@ class RootNode(Group):
             obj._is_playing = True  # Always true even if not watched.
             obj._is_running = True  # Always true even if not watched.
             obj.group = obj
-            cls.roots[obj.server.name] = obj
+            server._root_node = obj
             return obj
 
     def __init__(self, _=None):
@@ -892,8 +973,8 @@ class RootNode(Group):
 
         '''
 
-        for rn in cls.roots.values():
-            rn.free_all()
+        for server in list(srv.Server.all):
+            cls(server).free_all()
 
 
 class Synth(Node):
@@ -901,6 +982,8 @@ class Synth(Node):
 
     '''
 
+    __slots__ = ('def_name', '_synth_desc')
+
     def __init__(self, def_name, args=None, target=None,
                  add_action='addToHead', register=False):
         '''Create a synth node in the server.
@@ -926,18 +1009,21 @@ class Synth(Node):
 
         # // Immediately sends.
         super().__init__()
-        target = gpp.node_param(target)._as_target()
-        self.server = target.server
-        self.node_id = self.server._next_node_id()
-        add_action_id = type(self).add_actions[add_action]
-        self.group = target if add_action_id < 2 else target.group
+        new = Node._resolve_new(target, add_action)
+        self.server, self.node_id, self.group = new.server, new.node_id, new.group
+        # Synths share a few names, interned strings compare by identity.
+        if type(def_name) is str:
+            def_name = sys.intern(def_name)
         self.def_name = def_name
+        self._synth_desc = None
         self._init_register(register)
-        self.server.addr.send_msg(
+        msg = [
             '/s_new', # 9
-            self.def_name, self.node_id,
-            add_action_id, target.node_id,
-            *gpp.node_param(args or [])._as_osc_arg_list())
+            def_name, new.node_id,
+            new.add_action_id, new.target_nid]
+        if args:
+            gpp.node_param(args)._write_osc_args(msg)
+        _send_packed(new.server.addr, msg)
 
     # // does not send (used for bundling)
     @classmethod
@@ -959,7 +1045,10 @@ class Synth(Node):
         '''
 
         obj = super().basic_new(server, node_id)
+        if type(def_name) is str:
+            def_name = sys.intern(def_name)
         obj.def_name = def_name
+        obj._synth_desc = None
         return obj
 
     @classmethod
@@ -972,25 +1061,17 @@ class Synth(Node):
 
         '''
 
-        target = gpp.node_param(target)._as_target()
-        server = target.server
-        add_action_id = cls.add_actions[add_action]
-        synth = cls.basic_new(def_name, server)
-        synth.group = target if add_action_id < 2 else target.group
+        new = Node._resolve_new(target, add_action)
+        synth = cls.basic_new(def_name, new.server, new.node_id)
+        synth.group = new.group
         synth._init_register(register)
-        synth.server.addr.send_bundle(
-            None,
-            [
-                '/s_new', # 9
-                synth.def_name, synth.node_id,
-                add_action_id, target.node_id,
-                *gpp.node_param(args or [])._as_osc_arg_list()
-            ],
-            [
-                '/n_run', # 12
-                synth.node_id, 0
-            ]
-        )
+        msg = [
+            '/s_new', # 9
+            def_name, new.node_id,
+            new.add_action_id, new.target_nid]
+        if args:
+            gpp.node_param(args)._write_osc_args(msg)
+        new.server.addr.send_immediate_bundle(msg, _N_RUN, new.node_id, 0)
         return synth
 
     @classmethod
@@ -1004,12 +1085,14 @@ class Synth(Node):
 
         '''
 
-        target = gpp.node_param(target)._as_target()
+        target = _as_target(target)
         server = target.server
-        server.addr.send_msg(
+        msg = [
             '/s_new', def_name, -1,  # 9
-            cls.add_actions[add_action], target.node_id,
-            *gpp.node_param(args or [])._as_osc_arg_list())
+            _ADD_ACTIONS[add_action], target.node_id]
+        if args:
+            gpp.node_param(args)._write_osc_args(msg)
+        server.addr.send_msg_list(msg)
 
     @classmethod
     def after(cls, target, def_name, args=None):
@@ -1052,11 +1135,13 @@ class Synth(Node):
         new_node_id = target.node_id if same_id else None
         server = target.server
         synth = cls.basic_new(def_name, server, new_node_id)
-        synth.server.addr.send_msg(
+        msg = [
             '/s_new', # 9
-            synth.def_name, synth.node_id,
-            4, target.node_id, # 4 -> 'addReplace'
-            *gpp.node_param(args or [])._as_osc_arg_list())
+            def_name, synth.node_id,
+            4, target.node_id]  # 4 -> 'addReplace'
+        if args:
+            gpp.node_param(args)._write_osc_args(msg)
+        server.addr.send_msg_list(msg)
         return synth
 
     def get(self, index, action):
@@ -1072,16 +1157,9 @@ class Synth(Node):
 
         '''
 
-        def resp_func(msg, *_):
-            # // The server replies with a message of the
-            # // form: [/n_set, node ID, index, value].
-            # // We want 'value' which is at index 3.
-            fn.value(action, msg[3])
-
-        rpd.OscFunc(
-            resp_func, '/n_set', self.server.addr,
-            arg_template=[self.node_id, index]).one_shot()
-
+        # // The server replies with a message of the
+        # // form: [/n_set, node ID, index, value].
+        self.server._node_replies.add('/n_set', (self.node_id, index), action)
         self.server.addr.send_msg('/s_get', self.node_id, index)  # 44
 
     def getn(self, index, count, action):
@@ -1100,16 +1178,9 @@ class Synth(Node):
 
         '''
 
-        def resp_func(msg, *_):
-            # // The server replies with a message of the form
-            # // [/n_setn, node ID, index, count, *values].
-            # // We want '*values' which are at indexes 4 and above.
-            fn.value(action, msg[4:])
-
-        rpd.OscFunc(
-            resp_func, '/n_setn', self.server.addr,
-            arg_template=[self.node_id, index]).one_shot()
-
+        # // The server replies with a message of the form
+        # // [/n_setn, node ID, index, count, *values].
+        self.server._node_replies.add('/n_setn', (self.node_id, index), action)
         self.server.addr.send_msg('/s_getn', self.node_id, index, count)  # 45
 
     def seti(self, *args): # // args are [key, index, value, key, index, value ...]
@@ -1132,24 +1203,32 @@ class Synth(Node):
         '''
 
         osc_msg = []
-        synth_desc = sdc.SynthDescLib.default.at(self.def_name)  # Was global_.
+        synth_desc = self._synth_desc
         if synth_desc is None:
-            _logger.warning(
-                f"message seti failed, SynthDef '{self.def_name}' "
-                "not found in SynthDescLib")
-            return
-        for key, offset, value in utl.gen_cclumps(args, 3):
-            if key in synth_desc.control_dict:
-                cname = synth_desc.control_dict[key]
+            try:
+                synth_desc = sdc.SynthDescLib.default.at(self.def_name)  # Was global_.
+            except KeyError:
+                _logger.warning(
+                    f"message seti failed, SynthDef '{self.def_name}' "
+                    "not found in SynthDescLib")
+                return
+            # The desc of the def used to create the node doesn't change.
+            self._synth_desc = synth_desc
+        cdict_get = synth_desc.control_dict.get
+        for i in range(0, len(args) - 2, 3):
+            cname = cdict_get(args[i])
+            if cname is not None:
+                offset = args[i + 1]
+                value = args[i + 2]
                 if offset < cname.channels:
                     osc_msg.append(cname.index + offset)
                     if isinstance(value, list):
                         osc_msg.append(value[:cname.channels - offset]) # keep
                     else:
                         osc_msg.append(value)
-        self.server.addr.send_msg(
-            '/n_set', self.node_id,
-            *gpp.node_param(osc_msg)._as_osc_arg_list())
+        msg = ['/n_set', self.node_id]
+        gpp.node_param(osc_msg)._write_osc_args(msg)
+        _send_packed(self.server.addr, msg)
 
     def __repr__(self):
         return f'{type(self).__name__}({self.def_name} : {self.node_id})'
@@ -658,6 +658,8 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         self._status_watcher = sst.ServerStatusWatcher(server=self)
         self._node_watcher = ndw.NodeWatcher(server=self)
+        self._node_replies = ndw.NodeReplyWatcher(server=self)
+        self._root_node = nod.RootNode(self)  # Lives as long as the server.
         self._process_quit_requested = False
 
         self._set_client_id(0)  # Assumed id to work without booting.
@@ -812,6 +814,8 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
     def _new_node_allocators(self):
         self._node_allocator = type(self)._node_alloc_class(
             self.client_id, self.options.initial_node_id)
+        # Instance binding of the allocator method, see _next_node_id.
+        self._next_node_id = self._node_allocator.alloc
         # // defaultGroup and defaultGroups depend
         # // on allocator, so always make them here:
         self._make_default_groups()
@@ -897,6 +901,19 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         return self._node_allocator.alloc()
 
+    def _next_node_ids(self, n):
+        '''Return a list of ``n`` unique available node IDs.
+
+        Allocates the IDs at once for many nodes created together,
+        e.g. the notes of a chord. The IDs are not guaranteed to be
+        consecutive, they wrap around after the maximum temporary ID
+        and may interleave with IDs allocated by other threads, use
+        the list items instead of offsets from the first ID.
+
+        '''
+
+        return self._node_allocator.alloc_block(n)
+
     # def next_perm_node_id(self):
     #     '''Next avaiable permanent (default) node ID.'''
     #     return self._node_allocator.alloc_perm()
@@ -921,7 +938,7 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         '''
 
-        nod.RootNode(self).query_tree(controls, action, timeout)
+        self._root_node.query_tree(controls, action, timeout)
 
     def dump_tree(self, controls=False):
         '''Ask the server to dump its node tree to stdout.
@@ -938,7 +955,7 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
         elif self._pid is None:
             _logger.info(f'server {self.name} is not running')
             return
-        nod.RootNode(self).dump_tree(controls)  # Also needs stdout access.
+        self._root_node.dump_tree(controls)  # Also needs stdout access.
 
     def dump_osc(self, code=1):
         '''Enable server-side message dumping.
@@ -1005,6 +1022,29 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         return nad.BundleNetAddr(self)
 
+    def bundle(self, latency=None):
+        '''Return a BundleNetAddr context manager with explicit latency.
+
+        Parameters
+        ----------
+        latency: int | float | None
+            Bundle's latency as in ``send_bundle``. Default is `None`,
+            the bundle is performed immediately by the server.
+
+        Notes
+        -----
+        Same as ``bind`` but the collected messages are sent with the
+        given latency instead of the server's latency. It can be used to
+        send many node commands in a single packet::
+
+          with s.bundle():
+              for x in synths:
+                  x.set('freq', 440)
+
+        '''
+
+        return nad.BundleNetAddr(self, latency=latency)
+
 
     ### Default group ###
 
@@ -1379,7 +1419,7 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         # if(scopeWindow.notNil) { scopeWindow.quit }  # No GUI.
         self._volume.free_synth()
-        nod.RootNode(self).free_all()
+        self._root_node.free_all()
         self._set_client_id(0)
 
     def free_nodes(self):  # Was instance freeAll in sclang.
@@ -1407,7 +1447,7 @@ class Server(gpp.NodeParameter, metaclass=MetaServer):
 
         '''
 
-        target = gpp.node_param(target)._as_target()
+        target = nod._as_target(target)
         node_list = [x.node_id for x in node_list]
         self.addr.send_msg(
             '/n_order', nod.Node._action_number_for(add_action), # 62
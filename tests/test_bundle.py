@@ -8,10 +8,14 @@ import sc3
 sc3.init()
 
 from sc3.base.main import main
-from sc3.base.netaddr import NetAddr
+from sc3.base.netaddr import NetAddr, BundleNetAddr
 from sc3.base.responders import OscFunc
-from sc3.base._osclib import OscPacket
+from sc3.base._osclib import (
+    OscPacket, OscBundle, OscMessageTemplate, build_immediate_bundle,
+    packer_signature, message_packer)
 from sc3.base.clock import SystemClock
+from sc3.synth.server import s
+from sc3.synth.node import Synth
 
 
 class BundleTestCase(unittest.TestCase):
@@ -53,6 +57,154 @@ class BundleTestCase(unittest.TestCase):
 
         o.free()
 
+    def test_send_prepared(self):
+        oscaddr = '/msg'
+        template = OscMessageTemplate(oscaddr, 3)
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        self.assertEqual(
+            template.build(1, -1, 2),
+            n._osc_interface._build_msg(0, [oscaddr, 1, -1, 2]).dgram)
+
+        result = None
+
+        def func(msg):
+            nonlocal result
+            result = msg
+            main.resume()
+
+        o = OscFunc(func, oscaddr)
+        n.send_prepared(template, 1, -1, 2)
+        main.wait()
+        self.assertEqual(result, [oscaddr, 1, -1, 2])
+        o.free()
+
+        with BundleNetAddr(n, send=False) as b:
+            b.send_prepared(template, 1, -1, 2)
+        self.assertEqual(b.get_bundle(), [None, [oscaddr, 1, -1, 2]])
+
+    def test_message_packer(self):
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        test_messages = [
+            ['/msg'],
+            ['/msg', 1, 'freq', 0.5, 'amp', -1],
+            ['/msg', 'string', '[', 1, 2.5, ']', 'c1'],
+        ]
+        for msg in test_messages:
+            with self.subTest(msg=msg):
+                packer = message_packer(msg[0], packer_signature(msg[1:]))
+                self.assertEqual(
+                    packer.build(*msg[1:]),
+                    n._osc_interface._build_msg(0, msg).dgram)
+        self.assertIs(
+            message_packer('/msg', (int, 'freq', float)),
+            message_packer('/msg', (int, 'freq', float)))
+        self.assertIsNone(packer_signature([1, None]))
+        self.assertIsNone(packer_signature([True]))
+
+    def test_send_msg_list(self):
+        test_message = ['/msg', 1, 0.5, 'string', '[', 1, 2, ']']
+        result = None
+
+        def func(msg):
+            nonlocal result
+            result = msg
+            main.resume()
+
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        o = OscFunc(func, '/msg')
+        n.send_msg_list(test_message[:])
+        main.wait()
+        self.assertEqual(result, ['/msg', 1, 0.5, 'string', [1, 2]])
+        o.free()
+
+        with BundleNetAddr(n, send=False) as b:
+            b.send_msg_list(test_message)
+        self.assertEqual(b.get_bundle(), [None, test_message])
+
+    def test_send_immediate_bundle(self):
+        msg = ['/msg', 'string', 0.5, 1]
+        template = OscMessageTemplate('/msg', 2)
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        self.assertEqual(
+            build_immediate_bundle(
+                n._osc_interface._build_msg(0, msg).dgram,
+                template.build(1, 0)),
+            n._osc_interface._build_bundle(
+                0, [None, msg, ['/msg', 1, 0]]).dgram)
+
+        result = []
+
+        def func(msg, *_):
+            result.append(msg)
+            main.resume()
+
+        o = OscFunc(func, '/msg')
+        n.send_immediate_bundle(msg, template, 1, 0)
+        main.wait(tasks=2)
+        self.assertEqual(result, [msg, ['/msg', 1, 0]])
+        o.free()
+
+        with BundleNetAddr(n, send=False) as b:
+            b.send_immediate_bundle(msg, template, 1, 0)
+        self.assertEqual(b.get_bundle(), [None, msg, ['/msg', 1, 0]])
+
+    def test_bundle_latency(self):
+        oscaddr = '/msg'
+        result = []
+
+        def func(msg, time, *_):
+            result.append([msg[1], time])
+            main.resume()
+
+        n = NetAddr('127.0.0.1', NetAddr.lang_port())
+        o = OscFunc(func, oscaddr)
+        send_time = main.elapsed_time()
+        with BundleNetAddr(n, latency=0.5) as b:
+            b.send_msg(oscaddr, 0)
+            b.send_prepared(OscMessageTemplate(oscaddr, 1), 1)
+        main.wait(tasks=2)
+        self.assertEqual([r[0] for r in result], [0, 1])
+        self.assertEqual(result[0][1], result[1][1])
+        self.assertTrue(result[0][1] >= send_time + 0.5)
+        o.free()
+
+    def test_server_bundle(self):
+        sent = []
+        iface = s.addr._osc_interface
+        iface._send = lambda dgram, target: sent.append((dgram, target))
+        try:
+            x = Synth.basic_new('default', s, 2000)
+            with s.bundle():
+                x.run(False)
+                x.set('freq', 440)
+            with x.batched(0.5):
+                x.free()
+            # Nested in bind, collected by the enclosing bundle.
+            with s.bind():
+                with x.batched():
+                    x.run()
+                x.trace()
+        finally:
+            del iface._send
+
+        self.assertEqual(len(sent), 3)
+        for dgram, target in sent:
+            self.assertEqual(target, (s.addr.hostname, s.addr.port))
+            self.assertTrue(OscBundle.dgram_is_bundle(dgram))
+        bundles = [OscBundle(dgram) for dgram, _ in sent]
+        self.assertEqual(
+            [[m.address, *m.params] for m in bundles[0]],
+            [['/n_run', 2000, 0], ['/n_set', 2000, 'freq', 440]])
+        self.assertEqual(bundles[0].timetag, 1)  # Immediately.
+        self.assertEqual(
+            [[m.address, *m.params] for m in bundles[1]],
+            [['/n_free', 2000]])
+        self.assertNotEqual(bundles[1].timetag, 1)
+        self.assertEqual(
+            [[m.address, *m.params] for m in bundles[2]],
+            [['/n_run', 2000, 1], ['/n_trace', 2000]])
+        self.assertNotEqual(bundles[2].timetag, 1)  # Server latency.
+
     def test_calc_dgram_size(self):
         test_data = [0, ['/m1', 0.5], [1, ['/m2', 1]], ['/m3', 'string']]
         n = NetAddr('127.0.0.1', NetAddr.lang_port())
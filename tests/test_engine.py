@@ -0,0 +1,57 @@
+
+import unittest
+import itertools
+
+import sc3
+sc3.init()
+
+from sc3.synth._engine import NodeIDAllocator
+
+
+class NodeIDAllocatorTestCase(unittest.TestCase):
+    def test_alloc(self):
+        a = NodeIDAllocator(0, 1000)
+        self.assertEqual([a.alloc() for _ in range(3)], [1000, 1001, 1002])
+        a.reset()
+        self.assertEqual(a.alloc(), 1000)
+
+    def test_alloc_wrap(self):
+        a = NodeIDAllocator(0, 1000)
+        a._temp = itertools.count(0x03FFFFFE)
+        self.assertEqual(
+            [a.alloc() for _ in range(4)],
+            [0x03FFFFFE, 0x03FFFFFF, 1000, 1001])
+
+    def test_alloc_block(self):
+        a = NodeIDAllocator(0, 1000)
+        self.assertEqual(a.alloc_block(3), [1000, 1001, 1002])
+        self.assertEqual(a.alloc(), 1003)
+        self.assertEqual(a.alloc_block(0), [])
+
+    def test_alloc_block_wrap(self):
+        a = NodeIDAllocator(0, 1000)
+        a._temp = itertools.count(0x03FFFFFE)
+        self.assertEqual(
+            a.alloc_block(4), [0x03FFFFFE, 0x03FFFFFF, 1000, 1001])
+        self.assertEqual(a.alloc(), 1002)
+        # Whole block past the maximum.
+        a._temp = itertools.count(0x03FFFFFF + 1)
+        self.assertEqual(a.alloc_block(2), [1000, 1001])
+        self.assertEqual(a.alloc(), 1002)
+
+    def test_user_mask(self):
+        a = NodeIDAllocator(3, 1000)
+        mask = 3 << 26
+        self.assertEqual(a.alloc(), 1000 | mask)
+        self.assertEqual(a.alloc_block(2), [1001 | mask, 1002 | mask])
+        a._temp = itertools.count(0x03FFFFFF)
+        self.assertEqual(a.alloc(), 0x03FFFFFF | mask)
+        self.assertEqual(a.alloc(), 1000 | mask)
+        a._temp = itertools.count(0x03FFFFFF)
+        self.assertEqual(a.alloc_block(2), [0x03FFFFFF | mask, 1000 | mask])
+        for x in (a.alloc(), *a.alloc_block(2)):
+            self.assertEqual(x >> 26, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
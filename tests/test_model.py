@@ -57,6 +57,42 @@ class NotificationCenterTestCase(unittest.TestCase):
         for (o, m, l), a in zip(registrations, actions):
             self.assertIs(NotificationCenter._registrations[o][m][l], a, msg)
 
+    def test_auto_unregister(self):
+        a = self.Object()
+        b = self.Object()
+        values = []
+
+        def b_action(obj, msg, listener, *args):
+            values.append(args[0])
+
+        NotificationCenter.register(
+            a, 'value_changed', b, b_action, auto_unregister=True)
+        NotificationCenter.notify(a, 'value_changed', 1)
+        NotificationCenter.notify(a, 'value_changed', 2)
+        self.assertEqual(values, [1])
+        self.assertFalse(
+            NotificationCenter.registration_exists(a, 'value_changed', b))
+
+        # Registering again without the flag makes it permanent.
+        NotificationCenter.register(
+            a, 'value_changed', b, b_action, auto_unregister=True)
+        NotificationCenter.register(a, 'value_changed', b, b_action)
+        NotificationCenter.notify(a, 'value_changed', 3)
+        NotificationCenter.notify(a, 'value_changed', 4)
+        self.assertEqual(values, [1, 3, 4])
+
+    def test_only_obj(self):
+        a = self.Object()
+        b = self.Object()
+        values = []
+
+        NotificationCenter.register(
+            a, 'value_changed', b, lambda *args: values.append(args),
+            auto_unregister=True, only_obj=True)
+        NotificationCenter.notify(a, 'value_changed', 1)
+        NotificationCenter.notify(a, 'value_changed', 2)
+        self.assertEqual(values, [(a,)])
+
     # TODO
 
 
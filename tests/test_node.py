@@ -1,14 +1,20 @@
 
 import unittest
 import shutil
+import gc
+import weakref
 
 import sc3
 sc3.init()
 
 from sc3.base.main import main
+from sc3.base import systemactions as sac
+from sc3.base.netaddr import BundleNetAddr
 from sc3.synth.server import s
-from sc3.synth.node import Group, Synth
-from sc3.synth.synthdef import synthdef
+from sc3.synth import node as nod
+from sc3.synth.node import Group, Synth, RootNode
+from sc3.synth.synthdef import SynthDef, synthdef
+from sc3.synth.synthdesc import SynthDescLib
 from sc3.synth.ugens import Out, SinOsc
 
 
@@ -137,5 +143,184 @@ class NodeTestCase(unittest.TestCase):
         # s.free_nodes()
 
 
+
+class NodeMessagesTestCase(unittest.TestCase):
+    # Messages are collected without sending, no server needed.
+
+    def test_free_all_roots(self):
+        self.assertIs(RootNode(s), RootNode(s))
+        RootNode(s).free_all()
+        gc.collect()
+        with BundleNetAddr(s, send=False) as b:
+            RootNode.free_all_roots()
+        self.assertIn(['/g_freeAll', 0], b.get_bundle()[1:])
+
+    def test_root_node_collected(self):
+        # Only the server holds its root node, a discarded server and
+        # root node cycle is collected.
+        class Server():
+            pass
+
+        server = Server()
+        root = weakref.ref(RootNode(server))
+        self.assertIs(RootNode(server), root())
+        self.assertIs(server._root_node, root())
+        server = weakref.ref(server)
+        gc.collect()
+        self.assertIsNone(server())
+        self.assertIsNone(root())
+        self.assertIs(RootNode(s), s._root_node)
+
+    def test_on_free(self):
+        x = Synth.basic_new('default', s)
+        y = Synth.basic_new('default', s)
+        result = []
+        x.on_free(lambda *args: result.append(args))
+        y.on_free(lambda: result.append('y'))
+        # Replies are simulated, the watcher notifies /n_end.
+        s._node_watcher._n_end(x)
+        s._node_watcher._n_end(y)
+        s._node_watcher._n_end(x)
+        self.assertEqual(result, [(x,), 'y'])
+
+
+    def test_node_replies(self):
+        # Replies are fed to the watcher, requests are not sent.
+        x = Synth.basic_new('default', s)
+        y = Synth.basic_new('default', s)
+        replies = s._node_replies
+        result = []
+        with BundleNetAddr(s, send=False) as b:
+            x.get('freq', lambda v: result.append(('x freq', v)))
+            x.get('freq', lambda v: result.append(('x freq 2', v)))
+            x.get('amp', lambda v: result.append(('x amp', v)))
+            y.get('freq', lambda v: result.append(('y freq', v)))
+            x.getn(0, 2, lambda v: result.append(('x getn', v)))
+            x.query(lambda *msg: result.append(msg))
+        self.assertEqual(b.get_bundle()[1:], [
+            ['/s_get', x.node_id, 'freq'], ['/s_get', x.node_id, 'freq'],
+            ['/s_get', x.node_id, 'amp'], ['/s_get', y.node_id, 'freq'],
+            ['/s_getn', x.node_id, 0, 2], ['/n_query', x.node_id]])
+
+        replies._n_set(['/n_set', y.node_id, 'freq', 220.0])
+        # All the actions waiting on a key get the first reply.
+        replies._n_set(['/n_set', x.node_id, 'freq', 440.0])
+        replies._n_set(['/n_set', x.node_id, 'freq', 441.0])
+        replies._n_set(['/n_set', x.node_id, 'amp', 0.5])
+        replies._n_setn(['/n_setn', x.node_id, 0, 2, 1.0, 2.0])
+        replies._n_setn(['/n_setn', x.node_id, 1, 1, 3.0])
+        info = ['/n_info', x.node_id, 1, -1, -1, 0]
+        replies._n_info(info)
+        replies._n_info(info)
+        self.assertEqual(result, [
+            ('y freq', 220.0), ('x freq', 440.0), ('x freq 2', 440.0),
+            ('x amp', 0.5), ('x getn', [1.0, 2.0]), tuple(info)])
+
+        # Pending actions are dropped on clear, e.g. at server boot.
+        result.clear()
+        with BundleNetAddr(s, send=False):
+            x.get('freq', lambda v: result.append(v))
+            x.getn(0, 2, lambda v: result.append(v))
+            x.query(lambda *msg: result.append(msg))
+        self.assertIn(
+            replies._NodeReplyWatcher__on_server_boot,
+            sac.ServerBoot._servers[s])
+        replies._NodeReplyWatcher__on_server_boot(s)
+        replies._n_set(['/n_set', x.node_id, 'freq', 440.0])
+        replies._n_setn(['/n_setn', x.node_id, 0, 2, 1.0, 2.0])
+        replies._n_info(info)
+        self.assertEqual(result, [])
+
+
+    def test_query_tree_reply(self):
+        captured = dict()
+
+        class OscFunc():
+            def __init__(self, func, path, *_):
+                captured['func'] = func
+                captured['freed'] = False
+
+            def one_shot(self):
+                pass
+
+            def free(self):
+                captured['freed'] = True
+
+        def sched(delta, item):
+            captured['timeout'] = item
+
+        # Raw classmethod, restored as defined in the class.
+        save = nod.rpd.OscFunc, vars(nod.clk.SystemClock)['sched']
+        nod.rpd.OscFunc = OscFunc
+        nod.clk.SystemClock.sched = staticmethod(sched)
+        try:
+            g = Group.basic_new(s, 1)
+            for controls in (True, False):
+                with self.subTest(controls=controls):
+                    result = []
+                    with BundleNetAddr(s, send=False) as b:
+                        g.query_tree(controls, result.append)
+                    self.assertEqual(
+                        b.get_bundle()[1:],
+                        [['/g_queryTree', 1, int(controls)]])
+                    reply = [
+                        '/g_queryTree.reply', int(controls), 1, 3,
+                        2, 2,
+                        1000, -1, 'default',
+                        *([2, 'freq', 440.0, 0, 0.5] if controls else []),
+                        3, 0,
+                        1001, -1, 'sine', *([0] if controls else []),
+                        4, 1,
+                        5, 1,
+                        1002, -1, 'default',
+                        *([1, 'out', 2] if controls else [])]
+                    captured['func'](reply)
+                    captured['timeout']()
+                    self.assertFalse(captured['freed'])
+                    self.assertEqual(result, [{
+                        'Group(1)': {
+                            'Group(2)': {
+                                'Synth(1000, default)': {
+                                    'freq': 440.0, '0': 0.5}
+                                    if controls else {},
+                                'Group(3)': {}},
+                            'Synth(1001, sine)': {},
+                            'Group(4)': {
+                                'Group(5)': {
+                                    'Synth(1002, default)': {'out': 2}
+                                    if controls else {}}}}}])
+        finally:
+            nod.rpd.OscFunc, nod.clk.SystemClock.sched = save
+
+
+    def test_seti(self):
+        def graph(freq=(220, 330, 440), amp=0):
+            Out.ar(0, SinOsc.ar(freq).sum() * amp)
+
+        SynthDef('test_seti', graph).add()
+        x = Synth.basic_new('test_seti', s)
+        expected = [['/n_set', x.node_id, 1, '[', 1, 2, ']', 3, 0.5]]
+        with BundleNetAddr(s, send=False) as b:
+            # One more freq value is discarded.
+            x.seti('freq', 1, [1, 2, 3], 'amp', 0, 0.5, 'xxx', 0, 1)
+        self.assertEqual(b.get_bundle()[1:], expected)
+        self.assertIs(x._synth_desc, SynthDescLib.default.at('test_seti'))
+
+        # The desc is cached, later calls don't query the library.
+        SynthDescLib.default.remove_at('test_seti')
+        with BundleNetAddr(s, send=False) as b:
+            x.seti('freq', 1, [1, 2, 3], 'amp', 0, 0.5)
+        self.assertEqual(b.get_bundle()[1:], expected)
+
+        # Unknown def_name, warns and doesn't send.
+        y = Synth.basic_new('test_seti_unknown', s)
+        with BundleNetAddr(s, send=False) as b:
+            with self.assertLogs('sc3.synth.node', 'WARNING') as cm:
+                y.seti('freq', 0, 440)
+        self.assertEqual(b.get_bundle()[1:], [])
+        self.assertIn("'test_seti_unknown'", cm.output[0])
+        self.assertIsNone(y._synth_desc)
+
+
 if __name__ == '__main__':
     unittest.main()
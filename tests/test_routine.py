@@ -7,7 +7,7 @@ sc3.init()
 from sc3.base.main import main
 from sc3.base.stream import (
     Routine, routine, StopStream, PausedStream, AlwaysYield,
-    YieldAndReset, Condition, FlowVar)
+    YieldAndReset, Condition, OneShot, FlowVar)
 from sc3.base.clock import TempoClock
 from sc3.base.builtins import rrand
 
@@ -216,6 +216,32 @@ class RoutineTestCase(unittest.TestCase):
         main.wait(tasks=2)
         self.assertEqual(finish_value, 2)
 
+    def test_oneshot(self):
+        event = OneShot()
+        result = []
+
+        @routine
+        def r1():
+            yield from event.wait()
+            result.append(1)
+            # Already set, doesn't wait.
+            yield from event.wait()
+            result.append(2)
+            main.resume()
+
+        @routine
+        def r2():
+            yield 0
+            self.assertEqual(result, [])
+            event.set()
+            event.set()
+
+        r1.play()
+        r2.play()
+        main.wait()
+        self.assertTrue(event.is_set)
+        self.assertEqual(result, [1, 2])
+
     def test_flowvar(self):
         # Clock threads can't be blocked.
         test_var = FlowVar()